@@ -65,31 +65,16 @@ def analyze_scenario_1_data(csv_file):
     
     # Generate code for simulation engine
     print(f"\n=== SIMULATION ENGINE CODE ===")
-    print("Replace generate_person() method with:")
+    print("Replace the scenario 1 joint_probabilities in _build_scenario_tables() with:")
     print("""
-def generate_person(self):
-    \"\"\"Generate person using empirical joint distribution\"\"\"
-    joint_probs = {""")
+        joint_probabilities = {""")
     
     for (young, well_dressed), prob in joint_probs.items():
-        print(f"        ({young}, {well_dressed}): {prob},")
+        print(f"            ({young}, {well_dressed}): {prob},")
     
-    print("""    }
-    
-    rand = random.random()
-    cumsum = 0
-    for (young, well_dressed), prob in joint_probs.items():
-        cumsum += prob
-        if rand <= cumsum:
-            return {
-                'attributes': {
-                    'young': young,
-                    'well_dressed': well_dressed
-                }
-            }
-    
-    # Fallback (should never reach here)
-    return {'attributes': {'young': False, 'well_dressed': False}}
+    print("""        }
+        # Attribute order of the joint_probabilities keys
+        attr_order = ('young', 'well_dressed')
 """)
     
     return {
@@ -176,7 +161,7 @@ def analyze_complex_scenario_data(csv_file, scenario):
     
     # Print simulation engine update
     print(f"\n=== SIMULATION ENGINE UPDATES ===")
-    print(f"Update scenario {scenario} frequencies and correlations:")
+    print(f"Update scenario {scenario} frequencies and correlations in _build_scenario_tables():")
     print("\n# Frequencies:")
     for attr, freq in marginals.items():
         print(f"'{attr}': {freq},")
@@ -287,27 +272,16 @@ def predict_person_type_distribution(csv_file, scenario):
     
     # Generate code for simulation engine
     print(f"\n=== SIMULATION CODE GENERATION ===")
-    print(f"Updated generate_person() method for scenario {scenario}:")
+    print(f"Replace the scenario {scenario} joint_probabilities in _build_scenario_tables() with:")
     print('"""')
-    print('def generate_person(self):')
-    print('    """Generate person using empirical distribution"""')
-    print('    import numpy as np')
-    print('    ')
-    print('    # Person type probabilities from data analysis')
-    print('    types_and_probs = [')
+    print('        joint_probabilities = {')
     
     for person_type, prob in type_probabilities.items():
-        attrs_dict = {attribute_cols[i]: person_type[i] for i in range(len(attribute_cols))}
-        print(f'        ({attrs_dict}, {prob}),')
-    
-    print('    ]')
-    print('    ')
-    print('    # Sample person type')
-    print('    types = [tp[0] for tp in types_and_probs]')
-    print('    probs = [tp[1] for tp in types_and_probs]')
-    print('    selected_idx = np.random.choice(len(types), p=probs)')
-    print('    ')
-    print('    return {"attributes": types[selected_idx]}')
+        print(f'            {tuple(bool(value) for value in person_type)}: {prob},')
+    
+    print('        }')
+    print('        # Attribute order of the joint_probabilities keys')
+    print(f'        attr_order = {tuple(attribute_cols)}')
     print('"""')
     
     return {
@@ -105,7 +105,7 @@ def run_simulation_with_bouncer(bouncer_class, scenario_config, scenario_number,
         print(f"\n--- Running scenario {scenario_number} simulation for: {bouncer_class.__name__} ---")
     
     # 1. Initialize the simulation engine
-    simulation = SimulationEngine(scenario_config, scenario_number)
+    simulation = SimulationEngine(scenario_config, scenario_number, verbose=verbose)
     
     # 2. Create the mock urlopen function and apply the monkey-patch
     mock_handler = create_mock_handler(simulation)
@@ -1,334 +1,386 @@
 
 import random
 import json
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
+
+# Expected attribute sets for each scenario
+SCENARIO_1_ATTRS = frozenset({'young', 'well_dressed'})
+SCENARIO_2_ATTRS = frozenset({'techno_lover', 'well_connected', 'creative', 'berlin_local'})
+SCENARIO_3_ATTRS = frozenset({'underground_veteran', 'international', 'fashion_forward',
+                              'queer_friendly', 'vinyl_collector', 'german_speaker'})
+
+@lru_cache(maxsize=None)
+def _build_scenario_tables(scenario_number):
+    """
+    Builds the read-only probability and sampling tables for a scenario.
+
+    Cached per scenario number so every PersonGenerator for the same scenario
+    shares one copy of the tables instead of rebuilding them for each game.
+    Mappings are returned as read-only proxies so no caller can change the
+    tables seen by other generators.
+    """
+    # Scenario-specific attribute frequencies and joint probabilities
+    if scenario_number == 1:
+        # Use observed marginal probabilities from scenario data
+        attribute_frequencies = {
+            'young': 0.3149,
+            'well_dressed': 0.3223
+        }
+        # Joint probabilities from observed behavior
+        joint_probabilities = {
+            (False, False): 0.5024,  # P(young=False, well_dressed=False)
+            (False, True): 0.1827,   # P(young=False, well_dressed=True)
+            (True, False): 0.1753,   # P(young=True, well_dressed=False)
+            (True, True): 0.1396     # P(young=True, well_dressed=True)
+        }
+        # Attribute order of the joint_probabilities keys
+        attr_order = ('young', 'well_dressed')
+        # Scenario 1 correlations: young and well_dressed correlation
+        correlations = {
+            'young': {
+                'young': 1,
+                'well_dressed': 0.1756  # Observed correlation
+            },
+            'well_dressed': {
+                'young': 0.1756,  # Observed correlation
+                'well_dressed': 1
+            }
+        }
+    elif scenario_number == 2:
+        attribute_frequencies = {
+            'techno_lover': 0.6265000000000001,
+            'well_connected': 0.4700000000000001,
+            'creative': 0.06227,
+            'berlin_local': 0.398
+        }
+        # Joint probabilities from observed behavior for scenario 2
+        joint_probabilities = {
+            (False, False, True, True): 0.09824164878945756,    # P(berlin_local=False, creative=False, techno_lover=True, well_connected=True)
+            (False, False, True, False): 0.4177329144958627,    # P(berlin_local=False, creative=False, techno_lover=True, well_connected=False)
+            (True, False, False, True): 0.24651394422310757,    # P(berlin_local=True, creative=False, techno_lover=False, well_connected=True)
+            (True, False, True, False): 0.013790989886607416,   # P(berlin_local=True, creative=False, techno_lover=True, well_connected=False)
+            (True, True, True, True): 0.025896414342629483,     # P(berlin_local=True, creative=True, techno_lover=True, well_connected=True)
+            (True, False, False, False): 0.04863239350291143,  # P(berlin_local=True, creative=False, techno_lover=False, well_connected=False)
+            (True, False, True, True): 0.04752145265093472,    # P(berlin_local=True, creative=False, techno_lover=True, well_connected=True)
+            (False, False, False, True): 0.03162350597609562,  # P(berlin_local=False, creative=False, techno_lover=False, well_connected=True)
+            (False, False, False, False): 0.03505209929512718, # P(berlin_local=False, creative=False, techno_lover=False, well_connected=False)
+            (True, True, True, False): 0.007738277658596384,   # P(berlin_local=True, creative=True, techno_lover=True, well_connected=False)
+            (True, True, False, True): 0.006838032485442844,   # P(berlin_local=True, creative=True, techno_lover=False, well_connected=True)
+            (False, True, True, True): 0.010247471651854122,   # P(berlin_local=False, creative=True, techno_lover=True, well_connected=True)
+            (False, True, False, True): 0.0028539687404229236, # P(berlin_local=False, creative=True, techno_lover=False, well_connected=True)
+            (False, True, True, False): 0.0049800796812749,    # P(berlin_local=False, creative=True, techno_lover=True, well_connected=False)
+            (True, True, False, False): 0.0015897946674839104, # P(berlin_local=True, creative=True, techno_lover=False, well_connected=False)
+            (False, True, False, False): 0.000747011952191235  # P(berlin_local=False, creative=True, techno_lover=False, well_connected=False)
+        }
+        # Attribute order of the joint_probabilities keys
+        attr_order = ('berlin_local', 'creative', 'techno_lover', 'well_connected')
+        # Scenario 2 correlations
+        correlations = {
+            'techno_lover': {
+                'techno_lover': 1,
+                'well_connected': -0.4696169332674324,
+                'creative': 0.09463317039891586,
+                'berlin_local': -0.6549403815606182
+            },
+            'well_connected': {
+                'techno_lover': -0.4696169332674324,
+                'well_connected': 1,
+                'creative': 0.14197259140471485,
+                'berlin_local': 0.5724067808436452
+            },
+            'creative': {
+                'techno_lover': 0.09463317039891586,
+                'well_connected': 0.14197259140471485,
+                'creative': 1,
+                'berlin_local': 0.14446459505650772
+            },
+            'berlin_local': {
+                'techno_lover': -0.6549403815606182,
+                'well_connected': 0.5724067808436452,
+                'creative': 0.14446459505650772,
+                'berlin_local': 1
+            }
+        }
+    elif scenario_number == 3:
+        attribute_frequencies = {
+            'underground_veteran': 0.6794999999999999,
+            'international': 0.5735,
+            'fashion_forward': 0.6910000000000002,
+            'queer_friendly': 0.04614,
+            'vinyl_collector': 0.044539999999999996,
+            'german_speaker': 0.4565000000000001
+        }
+        # Joint probabilities from observed behavior for scenario 3
+        joint_probabilities = {
+            (True, False, True, False, True, False): 0.2606859024844276,   # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
+            (False, True, False, False, True, False): 0.1567981671081836,  # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
+            (True, False, True, False, False, False): 0.15173265554521373, # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
+            (True, True, False, False, True, False): 0.10150712393498962,  # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
+            (True, True, False, False, False, False): 0.06502828094794874, # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
+            (False, False, True, False, True, False): 0.0439428653254099,  # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
+            (True, True, True, False, True, False): 0.02534545714899406,   # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
+            (False, True, False, False, False, False): 0.021998281663922103, # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
+            (True, True, True, False, False, False): 0.019886160234839263, # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
+            (False, False, True, False, False, False): 0.016252595403450993, # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
+            (False, True, True, False, True, False): 0.013800386625617528,  # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
+            (True, False, False, False, True, False): 0.013191809264695353, # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
+            (False, False, False, False, False, False): 0.013156010596405813, # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
+            (True, False, False, False, False, False): 0.01267272857449703, # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
+            (False, True, False, False, True, True): 0.007213431660342235,  # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
+            (False, False, False, False, True, False): 0.006873344311591608, # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
+            (False, True, True, False, False, False): 0.00678384764086776,  # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
+            (True, False, True, True, True, False): 0.004958115558101239,   # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
+            (True, True, True, True, True, True): 0.004206343524020906,     # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
+            (False, True, True, False, True, True): 0.0039199541777045896,  # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
+            (True, True, True, True, True, False): 0.0033650748192167253,  # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
+            (False, True, False, True, True, True): 0.0029712894680317893,  # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
+            (True, True, False, True, True, False): 0.00289969213145271,   # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
+            (True, False, True, True, True, True): 0.0028638934631631703,  # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
+            (True, True, False, True, True, True): 0.0025596047827020833,  # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
+            (False, True, True, True, True, True): 0.002398510775399155,   # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
+            (True, False, True, True, False, False): 0.0020763227607932984, # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
+            (True, True, False, False, True, True): 0.002022624758358989,   # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
+            (True, False, False, True, True, False): 0.00191522875349037,  # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
+            (False, True, False, True, True, False): 0.0018615307510560608, # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
+            (False, False, False, False, True, True): 0.0015930407388845135, # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
+            (True, False, False, True, True, True): 0.0015751414047397436,  # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
+            (True, True, True, False, True, True): 0.0014856447340158947,   # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
+            (True, True, True, True, False, False): 0.0015214434023054343,  # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
+            (False, False, True, False, True, True): 0.0013424500608577362,  # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
+            (True, True, False, True, False, False): 0.0012350540559891172, # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
+            (True, False, True, False, True, True): 0.001252953390133887,   # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
+            (False, True, True, True, True, False): 0.0011276580511204984,  # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
+            (False, False, True, True, True, False): 0.0010739600486861889, # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
+            (True, True, True, True, False, True): 0.0010202620462518794,   # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
+            (False, False, False, True, True, True): 0.0009486647096728001, # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
+            (False, False, True, True, True, True): 0.0009307653755280304,  # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
+            (True, False, False, True, False, False): 0.000859168038948951,  # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
+            (True, False, True, True, False, True): 0.0008233693706594115,  # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
+            (False, True, False, False, False, True): 0.0008054700365146416, # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
+            (False, True, True, False, False, True): 0.0007159733657907926,  # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
+            (True, False, False, True, False, True): 0.0006980740316460227,  # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
+            (True, True, False, True, False, True): 0.0006801746975012529,  # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
+            (False, False, False, True, True, False): 0.0006622753633564832, # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
+            (True, False, True, False, False, True): 0.0006443760292117133,  # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
+            (True, False, False, False, True, True): 0.0005190806901983246,  # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
+            (False, False, True, True, False, True): 0.00041168468532970574,  # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
+            (False, True, False, True, False, True): 0.0003758860170401661,  # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
+            (False, True, True, True, False, False): 0.0003579866828953963,  # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
+            (False, False, True, True, False, False): 0.0003579866828953963,  # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
+            (False, True, False, True, False, False): 0.0003579866828953963,  # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
+            (False, True, True, True, False, True): 0.0003579866828953963,   # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
+            (False, False, False, True, False, True): 0.00032218801460585667,  # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
+            (False, False, False, True, False, False): 0.0002684900121715472, # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
+            (True, True, False, False, False, True): 0.0002684900121715472,  # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
+            (True, True, True, False, False, True): 0.00017899334144769814,   # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
+            (False, False, True, False, False, True): 0.00016109400730292834, # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
+            (False, False, False, False, False, True): 0.0001252953390133887, # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
+            (True, False, False, False, False, True): 5.369800243430944e-05  # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
+        }
+        # Attribute order of the joint_probabilities keys
+        attr_order = ('fashion_forward', 'german_speaker', 'international',
+                      'queer_friendly', 'underground_veteran', 'vinyl_collector')
+        # Scenario 3 correlations
+        correlations = {
+            'underground_veteran': {
+                'underground_veteran': 1,
+                'international': -0.08110175777152992,
+                'fashion_forward': -0.1696563475505309,
+                'queer_friendly': 0.03719928376753885,
+                'vinyl_collector': 0.07223521156389842,
+                'german_speaker': 0.11188766703422799
+            },
+            'international': {
+                'underground_veteran': -0.08110175777152992,
+                'international': 1,
+                'fashion_forward': 0.375711059360155,
+                'queer_friendly': 0.0036693314388711686,
+                'vinyl_collector': -0.03083247098181075,
+                'german_speaker': -0.7172529382519395
+            },
+            'fashion_forward': {
+                'underground_veteran': -0.1696563475505309,
+                'international': 0.375711059360155,
+                'fashion_forward': 1,
+                'queer_friendly': -0.0034530926793377476,
+                'vinyl_collector': -0.11024719606358546,
+                'german_speaker': -0.3521024461597403
+            },
+            'queer_friendly': {
+                'underground_veteran': 0.03719928376753885,
+                'international': 0.0036693314388711686,
+                'fashion_forward': -0.0034530926793377476,
+                'queer_friendly': 1,
+                'vinyl_collector': 0.47990640803167306,
+                'german_speaker': 0.04797381132680503
+            },
+            'vinyl_collector': {
+                'underground_veteran': 0.07223521156389842,
+                'international': -0.03083247098181075,
+                'fashion_forward': -0.11024719606358546,
+                'queer_friendly': 0.47990640803167306,
+                'vinyl_collector': 1,
+                'german_speaker': 0.09984452286269897
+            },
+            'german_speaker': {
+                'underground_veteran': 0.11188766703422799,
+                'international': -0.7172529382519395,
+                'fashion_forward': -0.3521024461597403,
+                'queer_friendly': 0.04797381132680503,
+                'vinyl_collector': 0.09984452286269897,
+                'german_speaker': 1
+            }
+        }
+    else:
+        raise ValueError(f"Invalid scenario number: {scenario_number}")
+
+    # Precompute the outcome table and its CDF so sampling is a binary search
+    outcomes = tuple(joint_probabilities.keys())
+    cum = list(accumulate(joint_probabilities.values()))
+    if abs(cum[-1] - 1.0) > 1e-9:
+        raise ValueError(f"Joint probabilities for scenario {scenario_number} sum to {cum[-1]}, expected 1.0")
+    # Guard against float drift leaving the final bucket just short of 1.0
+    cum[-1] = 1.0
+    # Each outcome packed as an int with bit i set when attr_order[i] is present
+    masks = tuple(sum(present << i for i, present in enumerate(outcome)) for outcome in outcomes)
+    # Attribute dict for each outcome, built once so generating a person is a dict copy.
+    # These are shared templates and must be copied before being handed out.
+    outcome_attributes = tuple(MappingProxyType(dict(zip(attr_order, outcome))) for outcome in outcomes)
+    attributes_by_mask = MappingProxyType(dict(zip(masks, outcome_attributes)))
+    # Set bit positions for every possible mask, so counting an admission is a table lookup
+    mask_bits = tuple(tuple(i for i in range(len(attr_order)) if mask >> i & 1)
+                      for mask in range(1 << len(attr_order)))
+
+    # The tables are shared through the cache, so expose them read-only
+    attribute_frequencies = MappingProxyType(attribute_frequencies)
+    joint_probabilities = MappingProxyType(joint_probabilities)
+    correlations = MappingProxyType({attr: MappingProxyType(row) for attr, row in correlations.items()})
+
+    return (attribute_frequencies, joint_probabilities, attr_order, correlations,
+            outcomes, tuple(cum), masks, outcome_attributes, attributes_by_mask, mask_bits)
+
 
 class PersonGenerator:
     """Generates people based on predefined attribute probabilities for different scenarios."""
-    def __init__(self, scenario_config, scenario_number=None):
+    def __init__(self, scenario_config, scenario_number=None, seed=None, rng=None):
         self.scenario_config = scenario_config
         self.constraints = scenario_config['constraints']
-        
-        # Define expected attribute sets for each scenario
-        scenario_1_attrs = {'young', 'well_dressed'}
-        scenario_2_attrs = {'techno_lover', 'well_connected', 'creative', 'berlin_local'}
-        scenario_3_attrs = {'underground_veteran', 'international', 'fashion_forward', 
-                           'queer_friendly', 'vinyl_collector', 'german_speaker'}
+        # Private RNG so simulations can be seeded independently of the global random module
+        self._rng = rng if rng is not None else random.Random(seed)
+        self._random = self._rng.random
         
         constraint_attrs = set(self.constraints.keys())
         
         # Determine scenario based on explicit number or constraint matching
         if scenario_number:
             detected_scenario = scenario_number
-        elif constraint_attrs == scenario_1_attrs:
+        elif constraint_attrs == SCENARIO_1_ATTRS:
             detected_scenario = 1
-        elif constraint_attrs == scenario_2_attrs:
+        elif constraint_attrs == SCENARIO_2_ATTRS:
             detected_scenario = 2
-        elif constraint_attrs == scenario_3_attrs:
+        elif constraint_attrs == SCENARIO_3_ATTRS:
             detected_scenario = 3
         else:
             raise ValueError(f"Unable to determine scenario. Constraints: {constraint_attrs}")
         
-        # Scenario-specific attribute frequencies and joint probabilities
-        if detected_scenario == 1:
-            # Use observed marginal probabilities from scenario data
-            self.attribute_frequencies = {
-                'young': 0.3149,
-                'well_dressed': 0.3223
-            }
-            # Joint probabilities from observed behavior
-            self.joint_probabilities = {
-                (False, False): 0.5024,  # P(young=False, well_dressed=False)
-                (False, True): 0.1827,   # P(young=False, well_dressed=True)
-                (True, False): 0.1753,   # P(young=True, well_dressed=False)
-                (True, True): 0.1396     # P(young=True, well_dressed=True)
-            }
-            # Scenario 1 correlations: young and well_dressed correlation
-            self.correlations = {
-                'young': {
-                    'young': 1,
-                    'well_dressed': 0.1756  # Observed correlation
-                },
-                'well_dressed': {
-                    'young': 0.1756,  # Observed correlation
-                    'well_dressed': 1
-                }
-            }
-        elif detected_scenario == 2:
-            self.attribute_frequencies = {
-                'techno_lover': 0.6265000000000001,
-                'well_connected': 0.4700000000000001,
-                'creative': 0.06227,
-                'berlin_local': 0.398
-            }
-            # Joint probabilities from observed behavior for scenario 2
-            self.joint_probabilities = {
-                (False, False, True, True): 0.09824164878945756,    # P(berlin_local=False, creative=False, techno_lover=True, well_connected=True)
-                (False, False, True, False): 0.4177329144958627,    # P(berlin_local=False, creative=False, techno_lover=True, well_connected=False)
-                (True, False, False, True): 0.24651394422310757,    # P(berlin_local=True, creative=False, techno_lover=False, well_connected=True)
-                (True, False, True, False): 0.013790989886607416,   # P(berlin_local=True, creative=False, techno_lover=True, well_connected=False)
-                (True, True, True, True): 0.025896414342629483,     # P(berlin_local=True, creative=True, techno_lover=True, well_connected=True)
-                (True, False, False, False): 0.04863239350291143,  # P(berlin_local=True, creative=False, techno_lover=False, well_connected=False)
-                (True, False, True, True): 0.04752145265093472,    # P(berlin_local=True, creative=False, techno_lover=True, well_connected=True)
-                (False, False, False, True): 0.03162350597609562,  # P(berlin_local=False, creative=False, techno_lover=False, well_connected=True)
-                (False, False, False, False): 0.03505209929512718, # P(berlin_local=False, creative=False, techno_lover=False, well_connected=False)
-                (True, True, True, False): 0.007738277658596384,   # P(berlin_local=True, creative=True, techno_lover=True, well_connected=False)
-                (True, True, False, True): 0.006838032485442844,   # P(berlin_local=True, creative=True, techno_lover=False, well_connected=True)
-                (False, True, True, True): 0.010247471651854122,   # P(berlin_local=False, creative=True, techno_lover=True, well_connected=True)
-                (False, True, False, True): 0.0028539687404229236, # P(berlin_local=False, creative=True, techno_lover=False, well_connected=True)
-                (False, True, True, False): 0.0049800796812749,    # P(berlin_local=False, creative=True, techno_lover=True, well_connected=False)
-                (True, True, False, False): 0.0015897946674839104, # P(berlin_local=True, creative=True, techno_lover=False, well_connected=False)
-                (False, True, False, False): 0.000747011952191235  # P(berlin_local=False, creative=True, techno_lover=False, well_connected=False)
-            }
-            # Scenario 2 correlations
-            self.correlations = {
-                'techno_lover': {
-                    'techno_lover': 1,
-                    'well_connected': -0.4696169332674324,
-                    'creative': 0.09463317039891586,
-                    'berlin_local': -0.6549403815606182
-                },
-                'well_connected': {
-                    'techno_lover': -0.4696169332674324,
-                    'well_connected': 1,
-                    'creative': 0.14197259140471485,
-                    'berlin_local': 0.5724067808436452
-                },
-                'creative': {
-                    'techno_lover': 0.09463317039891586,
-                    'well_connected': 0.14197259140471485,
-                    'creative': 1,
-                    'berlin_local': 0.14446459505650772
-                },
-                'berlin_local': {
-                    'techno_lover': -0.6549403815606182,
-                    'well_connected': 0.5724067808436452,
-                    'creative': 0.14446459505650772,
-                    'berlin_local': 1
-                }
-            }
-        elif detected_scenario == 3:
-            self.attribute_frequencies = {
-                'underground_veteran': 0.6794999999999999,
-                'international': 0.5735,
-                'fashion_forward': 0.6910000000000002,
-                'queer_friendly': 0.04614,
-                'vinyl_collector': 0.044539999999999996,
-                'german_speaker': 0.4565000000000001
-            }
-            # Joint probabilities from observed behavior for scenario 3
-            self.joint_probabilities = {
-                (True, False, True, False, True, False): 0.2606859024844276,   # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
-                (False, True, False, False, True, False): 0.1567981671081836,  # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
-                (True, False, True, False, False, False): 0.15173265554521373, # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
-                (True, True, False, False, True, False): 0.10150712393498962,  # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
-                (True, True, False, False, False, False): 0.06502828094794874, # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
-                (False, False, True, False, True, False): 0.0439428653254099,  # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
-                (True, True, True, False, True, False): 0.02534545714899406,   # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
-                (False, True, False, False, False, False): 0.021998281663922103, # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
-                (True, True, True, False, False, False): 0.019886160234839263, # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
-                (False, False, True, False, False, False): 0.016252595403450993, # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
-                (False, True, True, False, True, False): 0.013800386625617528,  # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
-                (True, False, False, False, True, False): 0.013191809264695353, # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
-                (False, False, False, False, False, False): 0.013156010596405813, # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
-                (True, False, False, False, False, False): 0.01267272857449703, # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
-                (False, True, False, False, True, True): 0.007213431660342235,  # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
-                (False, False, False, False, True, False): 0.006873344311591608, # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=False)
-                (False, True, True, False, False, False): 0.00678384764086776,  # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=False)
-                (True, False, True, True, True, False): 0.004958115558101239,   # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
-                (True, True, True, True, True, True): 0.004206343524020906,     # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
-                (False, True, True, False, True, True): 0.0039199541777045896,  # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
-                (True, True, True, True, True, False): 0.0033650748192167253,  # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
-                (False, True, False, True, True, True): 0.0029712894680317893,  # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
-                (True, True, False, True, True, False): 0.00289969213145271,   # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
-                (True, False, True, True, True, True): 0.0028638934631631703,  # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
-                (True, True, False, True, True, True): 0.0025596047827020833,  # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
-                (False, True, True, True, True, True): 0.002398510775399155,   # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
-                (True, False, True, True, False, False): 0.0020763227607932984, # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
-                (True, True, False, False, True, True): 0.002022624758358989,   # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
-                (True, False, False, True, True, False): 0.00191522875349037,  # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
-                (False, True, False, True, True, False): 0.0018615307510560608, # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
-                (False, False, False, False, True, True): 0.0015930407388845135, # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
-                (True, False, False, True, True, True): 0.0015751414047397436,  # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
-                (True, True, True, False, True, True): 0.0014856447340158947,   # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
-                (True, True, True, True, False, False): 0.0015214434023054343,  # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
-                (False, False, True, False, True, True): 0.0013424500608577362,  # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
-                (True, True, False, True, False, False): 0.0012350540559891172, # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
-                (True, False, True, False, True, True): 0.001252953390133887,   # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
-                (False, True, True, True, True, False): 0.0011276580511204984,  # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
-                (False, False, True, True, True, False): 0.0010739600486861889, # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
-                (True, True, True, True, False, True): 0.0010202620462518794,   # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
-                (False, False, False, True, True, True): 0.0009486647096728001, # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
-                (False, False, True, True, True, True): 0.0009307653755280304,  # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=True, underground_veteran=True, vinyl_collector=True)
-                (True, False, False, True, False, False): 0.000859168038948951,  # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
-                (True, False, True, True, False, True): 0.0008233693706594115,  # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
-                (False, True, False, False, False, True): 0.0008054700365146416, # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
-                (False, True, True, False, False, True): 0.0007159733657907926,  # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
-                (True, False, False, True, False, True): 0.0006980740316460227,  # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
-                (True, True, False, True, False, True): 0.0006801746975012529,  # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
-                (False, False, False, True, True, False): 0.0006622753633564832, # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=True, underground_veteran=True, vinyl_collector=False)
-                (True, False, True, False, False, True): 0.0006443760292117133,  # P(fashion_forward=True, german_speaker=False, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
-                (True, False, False, False, True, True): 0.0005190806901983246,  # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=False, underground_veteran=True, vinyl_collector=True)
-                (False, False, True, True, False, True): 0.00041168468532970574,  # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
-                (False, True, False, True, False, True): 0.0003758860170401661,  # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
-                (False, True, True, True, False, False): 0.0003579866828953963,  # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
-                (False, False, True, True, False, False): 0.0003579866828953963,  # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
-                (False, True, False, True, False, False): 0.0003579866828953963,  # P(fashion_forward=False, german_speaker=True, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
-                (False, True, True, True, False, True): 0.0003579866828953963,   # P(fashion_forward=False, german_speaker=True, international=True, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
-                (False, False, False, True, False, True): 0.00032218801460585667,  # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=True)
-                (False, False, False, True, False, False): 0.0002684900121715472, # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=True, underground_veteran=False, vinyl_collector=False)
-                (True, True, False, False, False, True): 0.0002684900121715472,  # P(fashion_forward=True, german_speaker=True, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
-                (True, True, True, False, False, True): 0.00017899334144769814,   # P(fashion_forward=True, german_speaker=True, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
-                (False, False, True, False, False, True): 0.00016109400730292834, # P(fashion_forward=False, german_speaker=False, international=True, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
-                (False, False, False, False, False, True): 0.0001252953390133887, # P(fashion_forward=False, german_speaker=False, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
-                (True, False, False, False, False, True): 5.369800243430944e-05  # P(fashion_forward=True, german_speaker=False, international=False, queer_friendly=False, underground_veteran=False, vinyl_collector=True)
-            }
-            # Scenario 3 correlations
-            self.correlations = {
-                'underground_veteran': {
-                    'underground_veteran': 1,
-                    'international': -0.08110175777152992,
-                    'fashion_forward': -0.1696563475505309,
-                    'queer_friendly': 0.03719928376753885,
-                    'vinyl_collector': 0.07223521156389842,
-                    'german_speaker': 0.11188766703422799
-                },
-                'international': {
-                    'underground_veteran': -0.08110175777152992,
-                    'international': 1,
-                    'fashion_forward': 0.375711059360155,
-                    'queer_friendly': 0.0036693314388711686,
-                    'vinyl_collector': -0.03083247098181075,
-                    'german_speaker': -0.7172529382519395
-                },
-                'fashion_forward': {
-                    'underground_veteran': -0.1696563475505309,
-                    'international': 0.375711059360155,
-                    'fashion_forward': 1,
-                    'queer_friendly': -0.0034530926793377476,
-                    'vinyl_collector': -0.11024719606358546,
-                    'german_speaker': -0.3521024461597403
-                },
-                'queer_friendly': {
-                    'underground_veteran': 0.03719928376753885,
-                    'international': 0.0036693314388711686,
-                    'fashion_forward': -0.0034530926793377476,
-                    'queer_friendly': 1,
-                    'vinyl_collector': 0.47990640803167306,
-                    'german_speaker': 0.04797381132680503
-                },
-                'vinyl_collector': {
-                    'underground_veteran': 0.07223521156389842,
-                    'international': -0.03083247098181075,
-                    'fashion_forward': -0.11024719606358546,
-                    'queer_friendly': 0.47990640803167306,
-                    'vinyl_collector': 1,
-                    'german_speaker': 0.09984452286269897
-                },
-                'german_speaker': {
-                    'underground_veteran': 0.11188766703422799,
-                    'international': -0.7172529382519395,
-                    'fashion_forward': -0.3521024461597403,
-                    'queer_friendly': 0.04797381132680503,
-                    'vinyl_collector': 0.09984452286269897,
-                    'german_speaker': 1
-                }
-            }
-        else:
-            raise ValueError(f"Invalid scenario number: {detected_scenario}")
+        (self.attribute_frequencies, self.joint_probabilities, self._attr_order, self.correlations,
+         self._outcomes, self._cum, self._masks, self._outcome_attributes,
+         self._attributes_by_mask, self._mask_bits) = _build_scenario_tables(detected_scenario)
+        # Bit for each attribute in the masks returned by generate_mask/generate_masks
+        self.attribute_bits = {attr: 1 << i for i, attr in enumerate(self._attr_order)}
+        # Correlations with rows and columns in attribute bit order, for policies that index by position
+        self.correlation_matrix = tuple(tuple(self.correlations[a][b] for b in self._attr_order)
+                                        for a in self._attr_order)
+
+        # Generated attributes and constraints must be the same set so counts can be kept by position
+        if constraint_attrs != set(self._attr_order):
+            raise ValueError(f"Constraints {constraint_attrs} do not match scenario {detected_scenario} attributes: {set(self._attr_order)}")
 
     def generate_person(self):
         """Generates a single person with attributes based on observed probabilities."""
-        # Initialize all constraint attributes as False
-        attributes = {attr: False for attr in self.constraints}
-        
-        # Use joint probabilities to maintain observed correlations for all scenarios
-        if hasattr(self, 'joint_probabilities') and self.joint_probabilities is not None:
-            # Generate correlated attributes using joint probabilities
-            rand_val = random.random()
-            cumulative = 0.0
-            
-            # Determine attribute order based on scenario
-            scenario_1_attrs = {'young', 'well_dressed'}
-            scenario_2_attrs = {'techno_lover', 'well_connected', 'creative', 'berlin_local'}
-            scenario_3_attrs = {'underground_veteran', 'international', 'fashion_forward', 
-                               'queer_friendly', 'vinyl_collector', 'german_speaker'}
-            
-            constraint_attrs = set(self.constraints.keys())
-            
-            if constraint_attrs == scenario_1_attrs:
-                # Scenario 1: (young, well_dressed)
-                for (young_val, well_dressed_val), prob in self.joint_probabilities.items():
-                    cumulative += prob
-                    if rand_val <= cumulative:
-                        attributes['young'] = young_val
-                        attributes['well_dressed'] = well_dressed_val
-                        break
-            elif constraint_attrs == scenario_2_attrs:
-                # Scenario 2: (berlin_local, creative, techno_lover, well_connected)
-                for (berlin_local_val, creative_val, techno_lover_val, well_connected_val), prob in self.joint_probabilities.items():
-                    cumulative += prob
-                    if rand_val <= cumulative:
-                        attributes['berlin_local'] = berlin_local_val
-                        attributes['creative'] = creative_val
-                        attributes['techno_lover'] = techno_lover_val
-                        attributes['well_connected'] = well_connected_val
-                        break
-            elif constraint_attrs == scenario_3_attrs:
-                # Scenario 3: (fashion_forward, german_speaker, international, queer_friendly, underground_veteran, vinyl_collector)
-                for (fashion_forward_val, german_speaker_val, international_val, queer_friendly_val, underground_veteran_val, vinyl_collector_val), prob in self.joint_probabilities.items():
-                    cumulative += prob
-                    if rand_val <= cumulative:
-                        attributes['fashion_forward'] = fashion_forward_val
-                        attributes['german_speaker'] = german_speaker_val
-                        attributes['international'] = international_val
-                        attributes['queer_friendly'] = queer_friendly_val
-                        attributes['underground_veteran'] = underground_veteran_val
-                        attributes['vinyl_collector'] = vinyl_collector_val
-                        break
-        else:
-            # Fallback to independent generation if joint probabilities not available
-            attributes.update({
-                attr: random.random() <= freq 
-                for attr, freq in self.attribute_frequencies.items()
-            })
-        
-        return {'attributes': attributes}
+        # Pick the first outcome whose cumulative probability reaches the draw
+        idx = bisect_left(self._cum, self._random())
+        return {'attributes': self._outcome_attributes[idx].copy()}
+
+    def generate_person_raw(self):
+        """Generates a single person as (outcome index, attribute tuple ordered by self._attr_order) without building a dict."""
+        idx = bisect_left(self._cum, self._random())
+        return idx, self._outcomes[idx]
+
+    def generate_mask(self):
+        """Generates a single person as an attribute bitmask ordered by self._attr_order."""
+        return self._masks[bisect_left(self._cum, self._random())]
+
+    def attributes_for_mask(self, mask):
+        """Expands an attribute bitmask into the attribute dict sent to the bouncer."""
+        return self._attributes_by_mask[mask].copy()
+
+    def generate_masks(self, n):
+        """Generates n people as attribute bitmasks in a single draw."""
+        return self._rng.choices(self._masks, cum_weights=self._cum, k=n)
+
+    def generate_people(self, n):
+        """Generates n people at once, drawing all joint outcomes in a single call."""
+        picked = self._rng.choices(self._outcome_attributes, cum_weights=self._cum, k=n)
+        return [{'attributes': attributes.copy()} for attributes in picked]
 
 class SimulationEngine:
     """Simulates the Berghain Challenge game locally for a given scenario configuration."""
-    def __init__(self, scenario_config, scenario_number=None):
+    def __init__(self, scenario_config, scenario_number=None, verbose=False, seed=None):
         self.config = scenario_config
-        self.person_generator = PersonGenerator(scenario_config, scenario_number)
+        self.verbose = verbose
+        self.person_generator = PersonGenerator(scenario_config, scenario_number, seed=seed)
+        self._attr_order = self.person_generator._attr_order
+        self._attr_index = {attr: i for i, attr in enumerate(self._attr_order)}
+        self._mask_bits = self.person_generator._mask_bits
         self.game_id = "local-sim-game"
         self.person_index = 0
         self.admitted_count = 0
         self.rejected_count = 0
-        self.current_attribute_counts = {attr: 0 for attr in self.config['constraints']}
+        # Admitted counts indexed by attribute bit position
+        self._counts = [0] * len(self._attr_order)
         self.status = "not_started"
         self.max_rejections = 20000
+        # People are pre-drawn in blocks of this size and handed out one at a time
+        self.generation_batch_size = 1024
+        self._pending_masks = []
         self.venue_capacity = self.config['venue_capacity']
         self.last_person_sent = None
+        self._last_mask = 0
+
+    @property
+    def current_attribute_counts(self):
+        """Admitted counts per constraint attribute, in constraint order."""
+        counts = self._counts
+        return {attr: counts[self._attr_index[attr]] for attr in self.config['constraints']}
 
     def start_game(self):
         """Initializes and starts a new game simulation, returning the initial game state."""
         self.person_index = 0
         self.admitted_count = 0
         self.rejected_count = 0
-        self.current_attribute_counts = {attr: 0 for attr in self.config['constraints']}
+        self._counts = [0] * len(self._attr_order)
         self.status = "running"
         self.last_person_sent = None
+        self._last_mask = 0
         
-        print("--- LOCAL SIMULATION STARTED ---")
-        print(f"Scenario constraints: {self.config['constraints']}")
-        print(f"Venue capacity: {self.venue_capacity}")
-        print(f"Attribute frequencies: {self.person_generator.attribute_frequencies}")
+        if self.verbose:
+            print("--- LOCAL SIMULATION STARTED ---")
+            print(f"Scenario constraints: {self.config['constraints']}")
+            print(f"Venue capacity: {self.venue_capacity}")
+            print(f"Attribute frequencies: {dict(self.person_generator.attribute_frequencies)}")
         
         game_data = {
             "gameId": self.game_id,
             "constraints": [{"attribute": k, "minCount": v} for k, v in self.config['constraints'].items()],
             "attributeStatistics": {
-                "relativeFrequencies": self.person_generator.attribute_frequencies,
-                "correlations": self.person_generator.correlations
+                # Copies, so callers cannot alter the generator's shared tables
+                "relativeFrequencies": dict(self.person_generator.attribute_frequencies),
+                "correlations": {attr: dict(row) for attr, row in self.person_generator.correlations.items()}
             }
         }
         return game_data
@@ -338,51 +390,160 @@ class SimulationEngine:
         if self.status != "running":
             return {"status": self.status, "reason": "Game is not running."}
 
+        admitted_count = self.admitted_count
+        rejected_count = self.rejected_count
+
         # Process the decision for the *previous* person, if a decision was made.
         # The first call for person 0 has no preceding decision.
         if decision is not None and self.last_person_sent is not None:
-            person_attrs = [attr for attr, present in self.last_person_sent['attributes'].items() if present]
             if decision:
-                self.admitted_count += 1
-                print(f"ADMITTED person {self.last_person_sent['personIndex']} with attributes: {person_attrs}")
+                admitted_count += 1
+                self.admitted_count = admitted_count
+                mask = self._last_mask
+                if self.verbose:
+                    person_attrs = [attr for i, attr in enumerate(self._attr_order) if mask >> i & 1]
+                    print(f"ADMITTED person {self.last_person_sent['personIndex']} with attributes: {person_attrs}")
                 # Update counts based on the attributes of the person just processed
-                for attr, present in self.last_person_sent['attributes'].items():
-                    if present and attr in self.current_attribute_counts:
-                        self.current_attribute_counts[attr] += 1
+                counts = self._counts
+                for i in self._mask_bits[mask]:
+                    counts[i] += 1
                 
                 # Print progress every 100 admissions
-                if self.admitted_count % 100 == 0:
-                    print(f"Progress update - Admitted: {self.admitted_count}, Rejected: {self.rejected_count}")
+                if self.verbose and admitted_count % 100 == 0:
+                    print(f"Progress update - Admitted: {admitted_count}, Rejected: {rejected_count}")
                     print(f"Current attribute counts: {self.current_attribute_counts}")
                     print(f"Required constraints: {self.config['constraints']}")
             else:
-                self.rejected_count += 1
-                if self.rejected_count % 1000 == 0:
-                    print(f"Rejected {self.rejected_count} people so far...")
+                rejected_count += 1
+                self.rejected_count = rejected_count
+                if self.verbose and rejected_count % 1000 == 0:
+                    print(f"Rejected {rejected_count} people so far...")
 
         # Check for game over conditions
-        if self.admitted_count >= self.venue_capacity:
-            self.status = "completed"
-            print("--- LOCAL SIMULATION COMPLETED: Venue full ---")
+        if admitted_count >= self.venue_capacity:
+            self._end_game("completed")
             return self._get_final_state()
             
-        if self.rejected_count >= self.max_rejections:
-            self.status = "failed"
-            print("--- LOCAL SIMULATION FAILED: Too many rejections ---")
+        if rejected_count >= self.max_rejections:
+            self._end_game("failed")
             return self._get_final_state()
 
         # Generate the next person for the bouncer to evaluate
-        next_person = self.person_generator.generate_person()
-        next_person['personIndex'] = self.person_index
+        pending_masks = self._pending_masks
+        if not pending_masks:
+            pending_masks = self._pending_masks = self.person_generator.generate_masks(self.generation_batch_size)
+        mask = self._last_mask = pending_masks.pop()
+        person_index = self.person_index
+        next_person = {
+            'attributes': self.person_generator.attributes_for_mask(mask),
+            'personIndex': person_index
+        }
         self.last_person_sent = next_person  # Store for the next decision cycle
-        self.person_index += 1
+        self.person_index = person_index + 1
 
         return {
             "status": self.status,
             "nextPerson": next_person,
-            "rejectedCount": self.rejected_count,
+            "rejectedCount": rejected_count,
         }
         
+    def batch_step(self, policy, batch_size=1024):
+        """
+        Draws a block of people and commits the policy's decisions for them in bulk.
+
+        policy is called with a list of attribute bitmasks and must return a
+        sequence with one truthy/falsy decision per mask, otherwise ValueError
+        is raised; test attributes with person_generator.attribute_bits, e.g.
+        mask & bits['young']. Decisions after the game ends are discarded. This is an alternative to the
+        per-person decide_and_next protocol and should not be interleaved with it.
+        """
+        if self.status != "running":
+            return {"status": self.status, "reason": "Game is not running."}
+
+        self.last_person_sent = None
+        masks = self.person_generator.generate_masks(batch_size)
+        decisions = policy(masks)
+        if len(decisions) != len(masks):
+            raise ValueError(f"Policy returned {len(decisions)} decisions for {len(masks)} people")
+        if self._commit(masks, decisions):
+            return self._get_final_state()
+
+        return {
+            "status": self.status,
+            "rejectedCount": self.rejected_count,
+            "admittedCount": self.admitted_count,
+        }
+
+    def run_episode(self, policy):
+        """
+        Plays a whole game in one tight loop and returns only the final state.
+
+        policy is called as policy(mask, counts, admitted_count, rejected_count)
+        for each person and returns a truthy value to admit them. mask uses the
+        bits in person_generator.attribute_bits and counts is the live list of
+        admitted attribute counts in the same bit order; it must not be modified.
+        No per-person response dicts are built.
+        """
+        self.start_game()
+        generate_masks = self.person_generator.generate_masks
+        batch_size = self.generation_batch_size
+        while not self._commit(generate_masks(batch_size), decide=policy):
+            pass
+        return self._get_final_state()
+
+    def _commit(self, masks, decisions=None, decide=None):
+        """
+        Admits or rejects each person in masks until the game ends.
+
+        Takes either decisions, one per mask, or decide, called as
+        decide(mask, counts, admitted_count, rejected_count) with the live
+        state before each person. Returns True if the game ended.
+        """
+        if decisions is None:
+            # Placeholder values; decide overwrites each one with live state
+            decisions = masks
+        counts = self._counts
+        mask_bits = self._mask_bits
+        # Counters and limits live in locals for the loop and are written back once
+        admitted = self.admitted_count
+        rejected = self.rejected_count
+        venue_capacity = self.venue_capacity
+        max_rejections = self.max_rejections
+        status = None
+
+        for mask, decision in zip(masks, decisions):
+            if decide is not None:
+                decision = decide(mask, counts, admitted, rejected)
+            if decision:
+                admitted += 1
+                for i in mask_bits[mask]:
+                    counts[i] += 1
+                if admitted >= venue_capacity:
+                    status = "completed"
+                    break
+            else:
+                rejected += 1
+                if rejected >= max_rejections:
+                    status = "failed"
+                    break
+
+        self.person_index += (admitted - self.admitted_count) + (rejected - self.rejected_count)
+        self.admitted_count = admitted
+        self.rejected_count = rejected
+        if status is None:
+            return False
+        self._end_game(status)
+        return True
+
+    def _end_game(self, status):
+        """Moves the game to its final status."""
+        self.status = status
+        if self.verbose:
+            if status == "completed":
+                print("--- LOCAL SIMULATION COMPLETED: Venue full ---")
+            else:
+                print("--- LOCAL SIMULATION FAILED: Too many rejections ---")
+
     def _get_final_state(self):
         """Constructs the final game state response."""
         return {
@@ -392,3 +553,29 @@ class SimulationEngine:
             "attributeCounts": self.current_attribute_counts,
             "reason": f"Game ended with status: {self.status}"
         }
+
+
+def _run_one(args):
+    """Runs a single seeded simulation to completion and returns its final state."""
+    scenario_config, seed, policy, batch_size = args
+    simulation = SimulationEngine(scenario_config, seed=seed)
+    simulation.start_game()
+    state = {"status": simulation.status}
+    while state["status"] == "running":
+        state = simulation.batch_step(policy, batch_size)
+    return state
+
+def run_batch(configs, seeds, policy, n_workers=None, batch_size=1024):
+    """
+    Runs independent simulations in parallel across processes.
+
+    Each game gets its own config and seed, so results are reproducible no
+    matter which worker runs it. policy is passed to SimulationEngine.batch_step
+    and must be picklable (e.g. a module-level function). On platforms that
+    spawn workers, call this from under an `if __name__ == "__main__":` guard.
+
+    Returns the final state dicts in the same order as configs.
+    """
+    jobs = [(config, seed, policy, batch_size) for config, seed in zip(configs, seeds)]
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(_run_one, jobs))